@@ -27,10 +27,15 @@ export function CaretBox({ anchor, el, width = 236, testid, onClose, children }:
   const left = Math.min(Math.max(8, anchor.left - 8), window.innerWidth - width - 8)
   const top = Math.min(anchor.bottom + 8, window.innerHeight - 120)
 
+  // Callers pass inline closures, so `onClose` is a new function every render.
+  // Read it through a ref: the window listeners are installed once per anchor,
+  // not torn down and re-added on each parent render.
+  const closeRef = React.useRef(onClose)
+  closeRef.current = onClose
   React.useEffect(() => {
-    const key = (e: KeyboardEvent) => { if (e.key === 'Escape') onClose() }
+    const key = (e: KeyboardEvent) => { if (e.key === 'Escape') closeRef.current() }
     const down = (e: PointerEvent) => {
-      if (!el.contains(e.target as Node)) onClose()
+      if (!el.contains(e.target as Node)) closeRef.current()
     }
     window.addEventListener('keydown', key)
     window.addEventListener('pointerdown', down)
@@ -38,7 +43,7 @@ export function CaretBox({ anchor, el, width = 236, testid, onClose, children }:
       window.removeEventListener('keydown', key)
       window.removeEventListener('pointerdown', down)
     }
-  }, [onClose, el])
+  }, [el])
 
   return (
     <div data-testid={testid} style={{ ...S.pop, left, top, width }}
@@ -64,6 +64,18 @@ export const BAR_H = 38     // bar box height (30px buttons + 2×3px padding + b
 export const BAR_GAP = 6    // gap between the window's bottom edge and the bar
 const CARET_GAP = 10        // gap between the bar/window edge and an open caret
 type CaretPlacement = 'below' | 'right' | 'left'
+// Caret offsets per placement. Carets are DOM children of the bar, so the side
+// placements are expressed from the bar's top edge in window coords and the
+// window width; 'below' does not depend on either and is one shared object.
+const CARET_BELOW: React.CSSProperties =
+  { position: 'absolute', top: '100%', left: '50%', transform: 'translateX(-50%)', marginTop: CARET_GAP }
+const CARET_POS: Record<CaretPlacement, (barTop: number, winW: number) => React.CSSProperties> = {
+  below: () => CARET_BELOW,
+  right: (barTop, winW) =>
+    ({ position: 'absolute', top: -barTop, left: '50%', marginLeft: winW / 2 + CARET_GAP, transform: 'none' }),
+  left: (barTop, winW) =>
+    ({ position: 'absolute', top: -barTop, right: '50%', marginRight: winW / 2 + CARET_GAP, left: 'auto', transform: 'none' }),
+}
 
 const STYLE_ID = 'spyde-toolbar-style'
 if (typeof document !== 'undefined' && !document.getElementById(STYLE_ID)) {
@@ -73,8 +85,12 @@ if (typeof document !== 'undefined' && !document.getElementById(STYLE_ID)) {
     '@keyframes spyde-pop{from{opacity:0;transform:translate(-50%,-6px)}to{opacity:1;transform:translate(-50%,0)}}' +
     '@keyframes spyde-pop-up{from{opacity:0;transform:translate(-50%,6px)}to{opacity:1;transform:translate(-50%,0)}}' +
     '.spyde-tb-btn{background:none;border:none;color:#cdd6f4;cursor:pointer;width:30px;height:30px;' +
-    'border-radius:6px;display:flex;align-items:center;justify-content:center;transition:background 90ms}' +
-    '.spyde-tb-btn:hover{background:rgba(137,180,250,0.18)}'
+    'border-radius:6px;display:flex;align-items:center;justify-content:center;transition:background 90ms;' +
+    'position:relative}' +
+    '.spyde-tb-btn:hover{background:rgba(137,180,250,0.18)}' +
+    // Lit state as a class, not an inline style object: toggling it flips one
+    // attribute instead of re-diffing a spread style on every button render.
+    '.spyde-tb-btn.active{background:#89b4fa;color:#11111b}'
   document.head.appendChild(s)
 }
 
@@ -113,12 +129,17 @@ export function FloatingToolbar({
   const { state, sendAction } = useSpyDE()
   const [openName, setOpenName] = React.useState<string | null>(null)
   const [placement, setPlacement] = React.useState<CaretPlacement>('below')
+  // One close handler shared by every caret, stable across renders.
+  const closeCaret = React.useCallback(() => setOpenName(null), [])
   const rootRef = React.useRef<HTMLDivElement>(null)
   // Wrapper around the open caret (position: static, so it does NOT affect the
   // caret's absolute positioning) used only to measure the caret's real size.
   const caretWrapRef = React.useRef<HTMLDivElement>(null)
   const caretBox = React.useRef<{ w: number; h: number } | null>(null)
   const live = state.activeActions.get(windowId) ?? EMPTY
+  // This window's sub-toolbar items (VI chips), read once per render rather
+  // than per button / per click.
+  const winSubs = state.subItems.get(windowId)
 
   // Keep the toolbar shown while a popout/caret is open or an action is live —
   // otherwise reveal only on hover (over the window or the toolbar).
@@ -127,13 +148,15 @@ export function FloatingToolbar({
 
   // Caret placement: prefer BELOW the bar (clear of the figure); if the caret
   // would run off the bottom of the MDI area, float it to the window's RIGHT
-  // (or LEFT when there is no room right either). Runs after every render so
-  // it re-evaluates as the window moves/resizes or the caret's content changes
-  // height — a caret pushed to the side snaps back below as soon as there is
-  // room again.
+  // (or LEFT when there is no room right either). Re-evaluated when the caret
+  // opens, when the window moves/resizes, and — via a ResizeObserver — when the
+  // caret's content changes height, so a caret pushed to the side snaps back
+  // below as soon as there is room again. Keyed on the scalar geometry, not the
+  // rect objects (rebuilt every render), so an unrelated re-render does not pay
+  // a forced layout read.
   const wr = winRect ?? { x: 0, y: 0, w: 0, h: 0 }
   const area = areaSize ?? { w: 100000, h: 100000 }
-  React.useLayoutEffect(() => {
+  const place = React.useCallback(() => {
     if (!openName) return
     const el = caretWrapRef.current?.firstElementChild as HTMLElement | null
     if (el) {
@@ -148,7 +171,20 @@ export function FloatingToolbar({
       next = wr.x + wr.w + CARET_GAP + cw <= area.w ? 'right' : 'left'
     }
     setPlacement(p => (p === next ? p : next))
-  })
+  }, [openName, wr.x, wr.y, wr.w, wr.h, area.w, area.h, inside])
+  React.useLayoutEffect(place, [place])
+  // The observer outlives geometry changes (the window drags under it), so it
+  // calls the latest `place` through a ref instead of re-subscribing per move.
+  const placeRef = React.useRef(place)
+  placeRef.current = place
+  React.useEffect(() => {
+    if (!openName || typeof ResizeObserver === 'undefined') return
+    const el = caretWrapRef.current?.firstElementChild
+    if (!el) return
+    const ro = new ResizeObserver(() => placeRef.current())
+    ro.observe(el)
+    return () => ro.disconnect()
+  }, [openName])
 
   React.useEffect(() => {
     if (!openName) return
@@ -158,13 +194,15 @@ export function FloatingToolbar({
     // navigator selector to preview a new pattern — so an outside click does not
     // close them. Plain param popouts still dismiss on an outside click.
     if (WIZARD_ACTIONS.has(openName)) return
+    // The toolbar never changes windows while a caret is open, so resolve its
+    // owning window once here rather than walking up the DOM on every press.
+    const win = rootRef.current?.closest('[data-testid="subwindow"]')
     const onDown = (e: MouseEvent) => {
       const target = e.target as Node
       if (rootRef.current?.contains(target)) return   // inside the toolbar/caret
       // Keep the caret OPEN while interacting with its own window — e.g. grabbing
       // the title bar to drag, or the resize handle. The caret is parented to the
       // window so it moves along. Only close on a click outside this window.
-      const win = rootRef.current?.closest('[data-testid="subwindow"]')
       if (win && win.contains(target)) return
       setOpenName(null)
     }
@@ -174,15 +212,27 @@ export function FloatingToolbar({
 
   // The DP marker overlay of an action is visible only while its caret is open;
   // deselecting (closing the caret or opening another) hides it. (Backend is a
-  // no-op for windows/actions without an overlay.)
+  // no-op for windows/actions without an overlay.) The first run syncs every
+  // overlay action; after that only the caret that closed and the one that
+  // opened can have changed, so only those two are sent.
+  const prevOverlayOpen = React.useRef<string | null | undefined>(undefined)
   React.useEffect(() => {
-    for (const name of OVERLAY_ACTIONS) {
+    const prev = prevOverlayOpen.current
+    prevOverlayOpen.current = openName
+    const names = prev === undefined ? OVERLAY_ACTIONS : [prev, openName]
+    for (const name of names) {
+      if (name === null || !OVERLAY_ACTIONS.has(name)) continue
       sendAction('set_overlay', { name, visible: openName === name }, windowId)
     }
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [openName])
 
-  const shown = actions.filter(a => !HIDDEN_ACTIONS.has(a.name))
+  // Only a new toolbar_config changes `actions`; hover/caret/playback renders
+  // reuse the filtered list and its name index.
+  const shown = React.useMemo(
+    () => actions.filter(a => !HIDDEN_ACTIONS.has(a.name)), [actions])
+  const byName = React.useMemo(
+    () => new Map(shown.map(a => [a.name, a] as const)), [shown])
   if (!shown.length) return null
 
   const click = (a: ToolbarAction) => {
@@ -195,7 +245,7 @@ export function FloatingToolbar({
     // Imaging / Vector VI) tears all its ROIs + output windows down (Qt
     // parity: an unchecked action removes its artifacts). Committed trees
     // are independent SignalTrees and survive.
-    const items = state.subItems.get(windowId)?.get(a.name) ?? []
+    const items = winSubs?.get(a.name) ?? []
     if (openName === a.name && hasSubs(a) && items.length > 0) {
       sendAction('set_action_active', { name: a.name, active: false }, windowId)
       setOpenName(null)
@@ -212,50 +262,37 @@ export function FloatingToolbar({
     setOpenName(openName === a.name ? null : a.name)
   }
 
-  const openAction = shown.find(a => a.name === openName) || null
+  const openAction = (openName !== null && byName.get(openName)) || null
 
-  // Where the bar's TOP edge sits in window coords — carets are DOM children of
-  // the bar, so the side placements are expressed relative to it.
+  // Where the bar's TOP edge sits in window coords.
   const barTopInWin = inside ? wr.h - BAR_H - BAR_GAP : wr.h + BAR_GAP
-  const caretPos: React.CSSProperties =
-    placement === 'below'
-      ? { position: 'absolute', top: '100%', left: '50%', transform: 'translateX(-50%)', marginTop: CARET_GAP }
-      : placement === 'right'
-        ? { position: 'absolute', top: -barTopInWin, left: '50%', marginLeft: wr.w / 2 + CARET_GAP, transform: 'none' }
-        : { position: 'absolute', top: -barTopInWin, right: '50%', marginRight: wr.w / 2 + CARET_GAP, left: 'auto', transform: 'none' }
+  const caretPos = CARET_POS[placement](barTopInWin, wr.w)
 
+  const pb = state.playback
   return (
     <div
       ref={rootRef}
       data-testid="floating-toolbar"
       onMouseEnter={onHoverShow}
       onMouseLeave={onHoverHide}
-      style={{
-        ...styles.bar,
-        ...(inside ? { bottom: BAR_GAP } : { top: '100%', marginTop: BAR_GAP }),
-        opacity: shownVisible ? 1 : 0,
-        pointerEvents: shownVisible ? 'auto' : 'none',
-        transition: 'opacity 140ms ease',
-      }}
+      style={BAR_STYLES[inside ? 'inside' : 'below'][shownVisible ? 'shown' : 'hidden']}
     >
       {shown.map(a => {
         // Movie playback reflects the session-wide clock (playback_state), NOT
         // the per-window activeActions set: the Play button stays lit while the
         // clock runs and un-lights when playback auto-stops at the movie end.
-        const pb = state.playback
         const playbackActive = a.name === 'Play' && pb.playing
         const ffSpeed = a.name === 'Fast Forward' && pb.playing && pb.speed > 1
           ? pb.speed : 0
         const active = openName === a.name || live.has(a.name)
-          || (state.subItems.get(windowId)?.get(a.name)?.length ?? 0) > 0
+          || (winSubs?.get(a.name)?.length ?? 0) > 0
           || playbackActive
         return (
           <button
             key={a.name}
             title={a.name}
             data-testid={`action-btn-${a.name}`}
-            className="spyde-tb-btn"
-            style={{ ...(active ? styles.btnActive : {}), position: 'relative' }}
+            className={active ? 'spyde-tb-btn active' : 'spyde-tb-btn'}
             onClick={() => click(a)}
           >
             {a.icon && a.icon.endsWith('.svg')
@@ -276,62 +313,62 @@ export function FloatingToolbar({
         {openAction && openAction.name === 'Orientation Mapping' && (
           <OrientationWizard
             caretPos={caretPos} windowId={windowId} sendAction={sendAction}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
         {openAction && openAction.name === 'Find Diffraction Vectors' && (
           <FindVectorsWizard
             caretPos={caretPos} windowId={windowId} sendAction={sendAction}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
         {openAction && openAction.name === 'Vector Orientation Mapping' && (
           <VectorOrientationWizard
             caretPos={caretPos} windowId={windowId} sendAction={sendAction}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
         {openAction && openAction.name === 'EBSD Indexing' && (
           <EbsdWizard
             caretPos={caretPos} windowId={windowId} sendAction={sendAction}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
         {openAction && openAction.name === 'Center Zero Beam' && (
           <CenterZeroBeamWizard
             caretPos={caretPos} windowId={windowId} sendAction={sendAction}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
         {openAction && openAction.name === 'Strain Mapping' && (
           <StrainWizard
             caretPos={caretPos} windowId={windowId} sendAction={sendAction}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
         {openAction && openAction.name === 'Crop' && (
           <CropWizard
             caretPos={caretPos} windowId={windowId} sendAction={sendAction}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
         {openAction && openAction.name === 'Fit' && (
           <FitWizard
             caretPos={caretPos} windowId={windowId} sendAction={sendAction}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
         {openAction && openAction.name === 'Remove Background' && (
           <BackgroundWizard
             caretPos={caretPos} windowId={windowId} sendAction={sendAction}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
         {openAction && !WIZARD_ACTIONS.has(openAction.name) && hasParams(openAction) && (
           <ParamPopout
             action={openAction} caretPos={caretPos} below={placement === 'below'}
             onRun={(params) => { onAction(openAction.name, windowId, params); setOpenName(null) }}
-            onClose={() => setOpenName(null)}
+            onClose={closeCaret}
           />
         )}
       </div>
@@ -339,7 +376,7 @@ export function FloatingToolbar({
         <SubToolbar
           action={openAction}
           up={placement !== 'below'}
-          items={state.subItems.get(windowId)?.get(openAction.name) ?? []}
+          items={winSubs?.get(openAction.name) ?? []}
           onSub={(sub) => { onAction(sub.name, windowId, defaultsOf(sub.parameters)) }}
           onUpdate={(name, params) => sendAction('update_vi', { name, params }, windowId)}
           onRemove={(itemName) => sendAction('set_action_active', { name: itemName, active: false }, windowId)}
@@ -456,8 +493,7 @@ function SubToolbar({ action, up, items, onSub, onUpdate, onRemove, onCommit }:
           <button
             data-testid={`vi-icon-${it.name}`}
             title={it.name}
-            className="spyde-tb-btn"
-            style={openVi === it.name ? styles.btnActive : undefined}
+            className={openVi === it.name ? 'spyde-tb-btn active' : 'spyde-tb-btn'}
             onClick={() => setOpenVi(openVi === it.name ? null : it.name)}
           >
             <ViShape type={it.vtype || 'disk'} color={it.color} />
@@ -614,8 +650,8 @@ const subBase: React.CSSProperties = {
 const styles: Record<string, React.CSSProperties> = {
   bar: {
     // Floats BELOW the window (inside it only as a no-room fallback — the
-    // vertical position is applied inline), centered, tracking move/resize.
-    // Reveal-on-hover is handled by the opacity/pointerEvents applied inline.
+    // vertical position comes from BAR_STYLES), centered, tracking move/resize.
+    // Reveal-on-hover is handled by the opacity/pointerEvents in BAR_STYLES.
     // The bar lives in the window's stacking context, so it shares the
     // window's z-level: a sibling window stacked above also covers the bar,
     // and a hidden bar (pointerEvents:none) never intercepts clicks headed
@@ -627,11 +663,6 @@ const styles: Record<string, React.CSSProperties> = {
     borderRadius: 10, padding: '3px 5px', zIndex: 12,
     boxShadow: '0 6px 20px rgba(0,0,0,0.5)',
   },
-  btnActive: {
-    background: '#89b4fa', color: '#11111b',
-    border: 'none', cursor: 'pointer', width: 30, height: 30, borderRadius: 6,
-    display: 'flex', alignItems: 'center', justifyContent: 'center',
-  },
   // Small "×N" corner badge on the Fast Forward button while speed > 1.
   speedBadge: {
     position: 'absolute', bottom: -3, right: -3,
@@ -709,3 +740,17 @@ const styles: Record<string, React.CSSProperties> = {
     alignItems: 'flex-end', gap: 8,
   },
 }
+
+// The bar's placement × visibility variants, built once so hover and caret
+// re-renders hand React the same style object instead of a fresh spread.
+const barVariant = (inside: boolean, shown: boolean): React.CSSProperties => ({
+  ...styles.bar,
+  ...(inside ? { bottom: BAR_GAP } : { top: '100%', marginTop: BAR_GAP }),
+  opacity: shown ? 1 : 0,
+  pointerEvents: shown ? 'auto' : 'none',
+  transition: 'opacity 140ms ease',
+})
+const BAR_STYLES = {
+  inside: { shown: barVariant(true, true), hidden: barVariant(true, false) },
+  below: { shown: barVariant(false, true), hidden: barVariant(false, false) },
+}
@@ -139,7 +139,10 @@ export function MDIArea() {
   }, [])
 
   const handleFocus = useCallback((id: string) => {
-    setFocusOrder(prev => [...prev.filter(x => x !== id), id])
+    // Already on top: keep the same array so a repeat click does not re-render
+    // every window.
+    setFocusOrder(prev =>
+      prev[prev.length - 1] === id ? prev : [...prev.filter(x => x !== id), id])
     setActiveWindow(parseInt(id, 10))
   }, [setActiveWindow])
 
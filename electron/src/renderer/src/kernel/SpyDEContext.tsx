@@ -336,6 +336,15 @@ type Action =
   | { type: 'REPORT_STATE'; report: ReportDocState }
   | { type: 'REPORT_FIGURE'; cellId: string; figure: SpyDEFigure }
 
+/** Deep equality for two toolbar configs. They are small JSON-shaped lists (a
+ *  few dozen descriptors at most), so a serialised compare is cheaper than the
+ *  MDI-wide re-render an identical re-send would otherwise cause. */
+function sameToolbar(a: ToolbarAction[] | undefined, b: ToolbarAction[]): boolean {
+  if (a === b) return true
+  if (!a || a.length !== b.length) return false
+  return JSON.stringify(a) === JSON.stringify(b)
+}
+
 function spydeReducer(state: State, action: Action): State {
   switch (action.type) {
     case 'READY':
@@ -422,8 +431,12 @@ function spydeReducer(state: State, action: Action): State {
       // toolbar_config can arrive BEFORE the figure message that creates the
       // window (PlotState emits it at construction). Upsert so it's never
       // dropped — the figure later fills in title/figures on the same record.
+      // The backend re-sends the config on every rebuild (signal-type change,
+      // vectors attached, state switch); an unchanged one keeps the same state
+      // object so no window re-renders.
+      const existing = state.windows.get(action.windowId)
+      if (existing && sameToolbar(existing.toolbarActions, action.actions)) return state
       const newWindows = new Map(state.windows)
-      const existing = newWindows.get(action.windowId)
       newWindows.set(action.windowId, {
         windowId: action.windowId,
         title: existing?.title ?? 'Plot',
@@ -497,6 +510,7 @@ function spydeReducer(state: State, action: Action): State {
     }
 
     case 'SET_ACTIVE':
+      if (state.activeWindowId === action.windowId) return state
       return { ...state, activeWindowId: action.windowId }
 
     case 'METADATA': {
@@ -534,8 +548,13 @@ function spydeReducer(state: State, action: Action): State {
     }
 
     case 'ACTION_ACTIVE': {
+      // The backend reports an action's state after each run and each failure
+      // (usually already off); an unchanged flag keeps the same maps so the
+      // window's toolbar does not re-render.
+      const current = state.activeActions.get(action.windowId)
+      if ((current?.has(action.name) ?? false) === action.active) return state
       const activeActions = new Map(state.activeActions)
-      const set = new Set(activeActions.get(action.windowId) ?? [])
+      const set = new Set(current ?? [])
       if (action.active) set.add(action.name)
       else set.delete(action.name)
       activeActions.set(action.windowId, set)
@@ -1886,7 +1905,9 @@ export function SpyDEProvider({ children }: { children: React.ReactNode }) {
   const setActiveWindow = (windowId: number) => {
     dispatch({ type: 'SET_ACTIVE', windowId })
     // Tell the backend too, so window-less actions (e.g. the File→Save menu,
-    // which can't know the focused window) can resolve the active plot.
+    // which can't know the focused window) can resolve the active plot. Sent
+    // on every focus, repeats included: the backend also re-applies the focus
+    // cache budgets, which must reach plots opened since the last send.
     window.electron.action('set_active', { window_id: windowId }, windowId)
   }
 
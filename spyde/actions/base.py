@@ -116,10 +116,8 @@ def fast_forward(toolbar: "ActionContext", toggled=None, *args, **kwargs):
 def add_fft_selector(toolbar: "ActionContext", action_name="", *args, **kwargs):
     """Add an FFT selector: a RectangleSelector on the parent that computes the
     FFT of the selected region into a new plot window."""
-    widgets = toolbar.action_widgets
-    if (action_name in widgets
-            and "plot_windows" in widgets[action_name]
-            and "FFT_Plot_Window" in widgets[action_name]["plot_windows"]):
+    slot = toolbar.action_widgets.get(action_name)
+    if slot is not None and "FFT_Plot_Window" in slot.plot_windows:
         return  # already initialised
 
     plot = toolbar.plot
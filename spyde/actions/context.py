@@ -12,6 +12,7 @@ here as ``self.params`` and forwarded as kwargs to the action function.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -38,6 +39,17 @@ def current_signal(src):
     return getattr(ps, "current_signal", None) if ps is not None else None
 
 
+@dataclass(slots=True)
+class ActionSlot:
+    """Persistent per-action state on a plot — what the Qt toolbar kept as the
+    ``action_widgets[name]`` dict of dicts, as plain attributes."""
+
+    widget: Any = None
+    layout: Any = None
+    plot_items: dict[str, Any] = field(default_factory=dict)
+    plot_windows: dict[str, Any] = field(default_factory=dict)
+
+
 class ActionContext:
     """Adapter exposing the old toolbar interface over the new objects."""
 
@@ -55,7 +67,7 @@ class ActionContext:
         # Stored on the plot so it survives across action invocations.
         if not hasattr(plot, "_action_widgets"):
             plot._action_widgets = {}
-        self.action_widgets = plot._action_widgets
+        self.action_widgets: dict[str, ActionSlot] = plot._action_widgets
 
     # ── Old toolbar attribute surface ──────────────────────────────────────────
 
@@ -69,18 +81,24 @@ class ActionContext:
 
     # ── Stateful action registration (replaces toolbar.register_*) ─────────────
 
+    def action_slot(self, action_name: str) -> ActionSlot:
+        """The persistent ActionSlot for *action_name* on this plot, created on
+        first use."""
+        slot = self.action_widgets.get(action_name)
+        if slot is None:
+            slot = self.action_widgets[action_name] = ActionSlot()
+        return slot
+
     def register_action_plot_item(self, action_name: str, item, key: str) -> None:
-        slot = self.action_widgets.setdefault(action_name, {})
-        slot.setdefault("plot_items", {})[key] = item
+        self.action_slot(action_name).plot_items[key] = item
 
     def register_action_plot_window(self, action_name: str, plot_window, key: str) -> None:
-        slot = self.action_widgets.setdefault(action_name, {})
-        slot.setdefault("plot_windows", {})[key] = plot_window
+        self.action_slot(action_name).plot_windows[key] = plot_window
 
     def add_action_widget(self, action_name: str, widget=None, layout=None) -> None:
-        slot = self.action_widgets.setdefault(action_name, {})
-        slot["widget"] = widget
-        slot["layout"] = layout
+        slot = self.action_slot(action_name)
+        slot.widget = widget
+        slot.layout = layout
 
     def actions(self) -> list:
         """No Qt actions in the Electron toolbar — return empty list."""
@@ -43,6 +43,38 @@ _TEST_ACTIONS = frozenset({
     "load_test_vectors", "run_test_orientation", "dump_dask_state",
 })
 
+# Toolbar actions whose modules still carry the Qt/interactive implementation
+# and haven't been ported to the host-agnostic template yet. Clicking them gives
+# a clear message instead of a confusing Qt-without-QApplication traceback.
+# (Virtual Imaging / FFT / Line Profile / Rebin ARE ported.)
+_NOT_YET_PORTED: frozenset[str] = frozenset()
+
+
+def _vector_overlays(tree) -> list:
+    # Two overlays: the SOURCE-DP one (_vector_overlay) and the one on the
+    # RESULT vectors-image window (_result_vector_overlay). The user clicks
+    # the action on EITHER window, so toggle both. The result window can carry
+    # more than one (a second signal plot via "Add Selector" gets its own);
+    # toggling only the primary left the others drawn.
+    from spyde.actions.find_vectors_action import _result_overlays
+    return [getattr(tree, "_vector_overlay", None), *_result_overlays(tree)]
+
+
+def _wizard_overlay(tree, wizard_attr: str) -> list:
+    wiz = getattr(tree, wizard_attr, None)
+    return [getattr(wiz, "overlay", None)] if wiz is not None else []
+
+
+# Toolbar action -> the live DP overlays it shows/hides on its signal tree.
+_OVERLAY_SOURCES = {
+    "Find Diffraction Vectors": _vector_overlays,
+    "Orientation Mapping": lambda tree: [
+        getattr(tree, "_orientation_overlay", None),
+        *_wizard_overlay(tree, "_om_wizard")],
+    "Vector Orientation Mapping": lambda tree: _wizard_overlay(tree, "_vom_wizard"),
+    "EBSD Indexing": lambda tree: _wizard_overlay(tree, "_ebsd_wizard"),
+}
+
 # The staged-action table (STAGED_HANDLERS) lives in spyde.actions.registry so
 # that adding an action only touches the actions package (+ toolbars.yaml).
 
@@ -319,34 +351,22 @@ class ActionRouterMixin:
             emit_error("Toolbar action: no active plot or action name")
             return
 
-        # Actions whose modules still carry the Qt/interactive implementation and
-        # haven't been ported to the host-agnostic template yet. Clicking them
-        # gives a clear message instead of a confusing Qt-without-QApplication
-        # traceback. (Virtual Imaging / FFT / Line Profile / Rebin ARE ported.)
-        NOT_YET_PORTED: set = set()
-        if name in NOT_YET_PORTED:
+        if name in _NOT_YET_PORTED:
             emit_error(f"'{name}' is not yet available in the Electron build.")
             return
 
         try:
-            import importlib
-            from spyde import TOOLBAR_ACTIONS
             from spyde.actions.context import ActionContext
+            from spyde.drawing.toolbars.plot_control_toolbar import (
+                resolve_action_function, toolbar_action_meta,
+            )
 
-            meta = TOOLBAR_ACTIONS["functions"].get(name)
-            if meta is None:
-                # Sub-toolbar action (e.g. "add_virtual_image") — search the
-                # subfunctions of every top-level action.
-                for parent in TOOLBAR_ACTIONS["functions"].values():
-                    subs = parent.get("subfunctions", {}) or {}
-                    if name in subs:
-                        meta = subs[name]
-                        break
+            # Top-level or sub-toolbar action (e.g. "add_virtual_image").
+            meta = toolbar_action_meta(name)
             if meta is None:
                 emit_error(f"Unknown toolbar action: {name}")
                 return
-            module_path, _, attr = meta["function"].rpartition(".")
-            target = getattr(importlib.import_module(module_path), attr)
+            target = resolve_action_function(meta["function"])
             ctx = ActionContext(plot=plot, params=params, action_name=name)
 
             # A target may be either an Action subclass (template style) or a
@@ -398,33 +418,12 @@ class ActionRouterMixin:
         still tracks the navigator while hidden, so re-selecting redraws the
         current frame."""
         tree = getattr(plot, "signal_tree", None) if plot is not None else None
-        if tree is None or not name:
+        if tree is None:
+            return
+        sources = _OVERLAY_SOURCES.get(name)
+        if sources is None:
             return
-        overlays = []
-        if name == "Find Diffraction Vectors":
-            # Two overlays: the SOURCE-DP one (_vector_overlay) and the one on the
-            # RESULT vectors-image window (_result_vector_overlay). The user clicks
-            # the action on EITHER window, so toggle both.
-            overlays.append(getattr(tree, "_vector_overlay", None))
-            # The result window can carry more than one (a second signal plot via
-            # "Add Selector" gets its own); toggling only the primary left the
-            # others drawn.
-            from spyde.actions.find_vectors_action import _result_overlays
-            overlays.extend(_result_overlays(tree))
-        elif name == "Orientation Mapping":
-            overlays.append(getattr(tree, "_orientation_overlay", None))
-            wiz = getattr(tree, "_om_wizard", None)
-            if wiz is not None:
-                overlays.append(getattr(wiz, "overlay", None))
-        elif name == "Vector Orientation Mapping":
-            wiz = getattr(tree, "_vom_wizard", None)
-            if wiz is not None:
-                overlays.append(getattr(wiz, "overlay", None))
-        elif name == "EBSD Indexing":
-            wiz = getattr(tree, "_ebsd_wizard", None)
-            if wiz is not None:
-                overlays.append(getattr(wiz, "overlay", None))
-        for ov in overlays:
+        for ov in sources(tree):
             if ov is not None and hasattr(ov, "set_visible"):
                 try:
                     ov.set_visible(visible)
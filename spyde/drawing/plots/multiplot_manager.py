@@ -21,6 +21,17 @@ logger = logging.getLogger(__name__)
 SELECTOR_COLORS = ["#00e676", "#40c4ff", "#ff9100", "#e040fb", "#ffea00", "#ff5252"]
 
 
+def _collect_windows(windows_dict: dict, out: list, seen: set) -> None:
+    """Flatten a nested ``{window: {child_window: {...}}}`` tree into *out*,
+    parents before children, each window once (*seen* holds their ids)."""
+    for win, children in windows_dict.items():
+        if id(win) not in seen:
+            seen.add(id(win))
+            out.append(win)
+        if children:
+            _collect_windows(children, out, seen)
+
+
 def _plot_window_dims(plot_window: "PlotWindow") -> int:
     """Derive the displayed dimensionality of a PlotWindow's current plot.
 
@@ -316,28 +327,5 @@ class MultiplotManager:
     @property
     def all_plot_windows(self) -> List["PlotWindow"]:
         windows: List["PlotWindow"] = []
-
-        def collect_windows(windows_dict: dict) -> None:
-            for win, children in windows_dict.items():
-                if win not in windows:
-                    windows.append(win)
-                if children:
-                    collect_windows(children)
-
-        collect_windows(self.plot_windows)
-
-        for win in list(windows):
-            plot = getattr(win, "current_plot_item", None)
-            state = getattr(plot, "plot_state", None) if plot else None
-            if state is None:
-                continue
-            for toolbar in [
-                state.toolbar_right, state.toolbar_left,
-                state.toolbar_bottom, state.toolbar_top,
-            ]:
-                plot_windows_attr = getattr(toolbar, "plot_windows", None)
-                if plot_windows_attr is None:
-                    continue
-                for item in plot_windows_attr:
-                    windows.append(item[1] if isinstance(item, tuple) else item)
+        _collect_windows(self.plot_windows, windows, set())
         return windows
@@ -1367,6 +1367,12 @@ class Plot:
             self._inflight_getinds.clear()
         except Exception:
             pass
+        # Release per-action state (ActionContext slots): it holds the action's
+        # selectors and output windows, which must not be kept alive by a
+        # closed plot.
+        action_widgets = getattr(self, "_action_widgets", None)
+        if action_widgets is not None:
+            action_widgets.clear()
         # Cancel any in-flight expensive-tier navigator read.
         nf = self._nav_future
         if nf is not None:
@@ -11,10 +11,13 @@ state becomes active.
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import TYPE_CHECKING, List, Optional
 
 from hyperspy.signal import BaseSignal
 
+from spyde.backend import ipc
+
 log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -22,10 +25,14 @@ if TYPE_CHECKING:
 
 
 class _StubToolbar:
-    """Shim so code that calls toolbar methods doesn't raise AttributeError."""
+    """Shim so code that calls toolbar methods doesn't raise AttributeError.
+
+    Stateless, so every PlotState shares the one _STUB_TOOLBAR instance; its
+    ``action_widgets`` is read-only so nothing can leak state between plots
+    through it (per-plot action state lives in ``Plot._action_widgets``).
+    """
 
-    def __init__(self):
-        self.action_widgets: dict = {}
+    action_widgets = MappingProxyType({})
 
     def hide(self) -> None: pass
     def show(self) -> None: pass
@@ -42,6 +49,9 @@ class _StubToolbar:
     def register_action_plot_window(self, *a, **kw): return None
 
 
+_STUB_TOOLBAR = _StubToolbar()
+
+
 class PlotState:
     """
     Visualization state for a (Plot, Signal) pair.
@@ -82,10 +92,10 @@ class PlotState:
         self.signal_tree_selectors_children: list = []
 
         # Stub toolbars — real toolbars are Electron components (Phase 4)
-        self.toolbar_top = _StubToolbar()
-        self.toolbar_bottom = _StubToolbar()
-        self.toolbar_left = _StubToolbar()
-        self.toolbar_right = _StubToolbar()
+        self.toolbar_top = _STUB_TOOLBAR
+        self.toolbar_bottom = _STUB_TOOLBAR
+        self.toolbar_left = _STUB_TOOLBAR
+        self.toolbar_right = _STUB_TOOLBAR
 
         # Send toolbar config to Electron
         self._send_toolbar_config()
@@ -98,51 +108,59 @@ class PlotState:
 
     # ── Toolbar config ─────────────────────────────────────────────────────────
 
+    def _window_id(self):
+        """The renderer window id this state's toolbar messages go to, or None
+        when the plot has no window (nothing to send to)."""
+        return getattr(getattr(self.plot, "plot_window", None), "window_id", None)
+
     def _send_toolbar_config(self) -> None:
         """Serialize TOOLBAR_ACTIONS for this state and emit to Electron."""
+        # A plot with no window (or a window without an id) has nowhere to send
+        # the config — skip filtering the whole action table for a message
+        # that would be dropped anyway.
+        window_id = self._window_id()
+        if window_id is None:
+            return
         try:
             from spyde.drawing.toolbars.plot_control_toolbar import (
                 get_toolbar_config_for_plot,
             )
             config = get_toolbar_config_for_plot(self)
-        except Exception:
+        except Exception as e:
+            # A broken toolbar must never break the plot it belongs to: log it
+            # and send an empty toolbar.
+            log.debug("building toolbar config failed: %s", e)
             config = []
-
-        window_id = getattr(getattr(self.plot, "plot_window", None), "window_id", None)
-        if window_id is None:
-            return
+        self._emit({
+            "type": "toolbar_config",
+            "window_id": window_id,
+            "plot_id": id(self.plot),
+            "toolbar_actions": config,
+        })
+
+    @staticmethod
+    def _emit(msg: dict) -> None:
+        """Send a toolbar message. Only a closed/broken protocol pipe is
+        tolerated — the backend may be shutting down under us. ``ipc.emit`` is
+        looked up per call so a test can capture messages by patching it."""
         try:
-            from spyde.backend.ipc import emit
-            emit({
-                "type": "toolbar_config",
-                "window_id": window_id,
-                "plot_id": id(self.plot),
-                "toolbar_actions": config,
-            })
-        except Exception as e:
-            log.debug("sending toolbar config failed: %s", e)
+            ipc.emit(msg)
+        except (OSError, ValueError) as e:
+            log.debug("emitting %s failed: %s", msg.get("type"), e)
 
     # ── Visibility ─────────────────────────────────────────────────────────────
 
     def show_toolbars(self) -> None:
-        window_id = getattr(getattr(self.plot, "plot_window", None), "window_id", None)
+        window_id = self._window_id()
         if window_id is None:
             return
-        try:
-            from spyde.backend.ipc import emit
-            emit({"type": "toolbars_show", "window_id": window_id, "plot_id": id(self.plot)})
-        except Exception as e:
-            log.debug("emitting toolbars_show failed: %s", e)
+        self._emit({"type": "toolbars_show", "window_id": window_id, "plot_id": id(self.plot)})
 
     def hide_toolbars(self) -> None:
-        window_id = getattr(getattr(self.plot, "plot_window", None), "window_id", None)
+        window_id = self._window_id()
         if window_id is None:
             return
-        try:
-            from spyde.backend.ipc import emit
-            emit({"type": "toolbars_hide", "window_id": window_id, "plot_id": id(self.plot)})
-        except Exception as e:
-            log.debug("emitting toolbars_hide failed: %s", e)
+        self._emit({"type": "toolbars_hide", "window_id": window_id, "plot_id": id(self.plot)})
 
     def update_toolbars(self) -> None:
         self._send_toolbar_config()
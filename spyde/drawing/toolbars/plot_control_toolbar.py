@@ -1,6 +1,7 @@
 from __future__ import annotations
 import importlib
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from pathlib import Path
 
@@ -14,8 +15,19 @@ from functools import partial
 logger = logging.getLogger(__name__)
 
 
+_ICON_PATH_CACHE: dict[str, str] = {}
+
+
 def resolve_icon_path(icon_value: str) -> str:
-    """Resolve an icon specification into an absolute path or Qt resource path."""
+    """Resolve an icon specification into an absolute path or Qt resource path.
+
+    Cached: every toolbar rebuild resolves the same handful of YAML icon
+    strings, and ``Path.resolve`` is a filesystem round trip each time.
+    """
+    hit = _ICON_PATH_CACHE.get(icon_value)
+    if hit is not None:
+        return hit
+
     # Keep Qt resource paths (e.g., ":/icons/foo.png") as-is
     if isinstance(icon_value, str) and icon_value.startswith(":"):
         return icon_value
@@ -32,7 +44,9 @@ def resolve_icon_path(icon_value: str) -> str:
     except Exception:
         base = Path(__file__).resolve().parent
 
-    return str((base / icon_value).resolve())
+    resolved = str((base / icon_value).resolve())
+    _ICON_PATH_CACHE[icon_value] = resolved
+    return resolved
 
 
 # Optional-extra name for each gated package, so a hidden action can tell the
@@ -127,6 +141,72 @@ def _resolve_signal_class(path: str) -> type:
     return cls
 
 
+_FUNCTION_CACHE: dict[str, object] = {}
+
+
+def resolve_action_function(path: str):
+    """Import and cache an action's callable (function or Action subclass) from
+    its dotted ``function:`` / ``setup_function:`` path.
+
+    Mirrors _resolve_signal_class: the backend resolves the target on every
+    toolbar click, and a loaded action module does not change mid-session.
+    """
+    fn = _FUNCTION_CACHE.get(path)
+    if fn is None:
+        module_path, _, attr = path.rpartition(".")
+        fn = getattr(importlib.import_module(module_path), attr)
+        _FUNCTION_CACHE[path] = fn
+    return fn
+
+
+# sub-action name -> (parent action name, sub meta)
+_SUB_ACTION_INDEX: dict[str, tuple[str, dict]] = {}
+
+
+def _index_sub_actions() -> None:
+    """(Re)build the sub-action name → (parent, meta) index. The FIRST parent
+    declaring a name wins, matching the order a linear scan of TOOLBAR_ACTIONS
+    would find. Built aside and swapped in, so a reader never sees it half-full."""
+    global _SUB_ACTION_INDEX
+    index: dict[str, tuple[str, dict]] = {}
+    for parent_name, parent in TOOLBAR_ACTIONS["functions"].items():
+        for sub_name, sub_meta in (parent.get("subfunctions", {}) or {}).items():
+            index.setdefault(sub_name, (parent_name, sub_meta))
+    _SUB_ACTION_INDEX = index
+
+
+def _indexed_sub_action(name: str) -> dict | None:
+    """The indexed meta for sub-action *name*, or None if it is not indexed or
+    its parent no longer declares that exact meta (removed or replaced)."""
+    hit = _SUB_ACTION_INDEX.get(name)
+    if hit is None:
+        return None
+    parent_name, sub_meta = hit
+    parent = TOOLBAR_ACTIONS["functions"].get(parent_name)
+    subs = (parent.get("subfunctions", {}) or {}) if parent is not None else {}
+    return sub_meta if subs.get(name) is sub_meta else None
+
+
+def toolbar_action_meta(name: str) -> dict | None:
+    """The TOOLBAR_ACTIONS meta for *name* — a top-level action or a
+    sub-toolbar action (e.g. ``add_virtual_image``) — or None if unknown.
+
+    Top-level actions are read straight from TOOLBAR_ACTIONS, so an action
+    registered at runtime is found immediately. Sub-actions go through a
+    name → meta index instead of a scan of every parent's subfunctions; a hit
+    is checked against its parent's current subfunctions, and a miss or stale
+    hit rebuilds the index once before giving up.
+    """
+    meta = TOOLBAR_ACTIONS["functions"].get(name)
+    if meta is not None:
+        return meta
+    meta = _indexed_sub_action(name)
+    if meta is None:
+        _index_sub_actions()
+        meta = _indexed_sub_action(name)
+    return meta
+
+
 def _gate_signal_type(plot_state: "PlotState", navigation_only) -> str:
     """The ``_signal_type`` string a ``signal_types``/``exclude_signal_types``
     gate should compare against for *plot_state*.
@@ -184,64 +264,15 @@ def get_toolbar_actions_for_plot(
     sub_toolbars = []  # Parallel list: each entry is a list of subfunction tuples
     setup_functions = []
 
+    # Same filter as the renderer config (get_toolbar_config_for_plot), so a
+    # button that is drawn is always one that dispatches, and vice versa.
+    gate = _plot_gate(plot_state)
     for action, meta in TOOLBAR_ACTIONS["functions"].items():
-        signal_types = meta.get("signal_types")
-        exclude_signal_types = meta.get("exclude_signal_types")
-        signal_class = meta.get("signal_class")
-        requires_vectors = meta.get("requires_vectors", False)
-        plot_dim = meta.get("plot_dim", [1, 2])
-        navigation_only = meta.get("navigation")
-        params = meta.get("parameters", {})
-
-        signal = plot_state.current_signal
-        plot_signal_type = _gate_signal_type(plot_state, navigation_only)
-
-        # requires_vectors: action only shows once the plot's signal tree has
-        # diffraction_vectors attached (set after Find Vectors completes).
-        # PlotState.rebuild_toolbars() re-runs this filter at that point.
-        tree = getattr(plot_state.plot, "signal_tree", None)
-        has_vectors = getattr(tree, "diffraction_vectors", None) is not None
-
-        add_action = (
-            (signal_types is None or plot_signal_type in signal_types)
-            # exclude_signal_types: keep an action OFF a signal_type even though
-            # it would match signal_class by isinstance. Matched on the
-            # _signal_type STRING so it covers lazy+eager variants uniformly
-            # (LazyDiffractionVectorsImage is NOT a subclass of the eager one,
-            # but both share the signal_type) — the dense diffraction actions
-            # use this to stay off the vectors-result image.
-            and (
-                exclude_signal_types is None
-                or plot_signal_type not in exclude_signal_types
-            )
-            # signal_class gates by isinstance, so subclasses qualify too
-            # (e.g. ElectronDiffraction2D passes a Diffraction2D gate)
-            and (
-                signal_class is None
-                or isinstance(signal, _resolve_signal_class(signal_class))
-            )
-            and (not requires_vectors or has_vectors)
-            # requires_original_metadata: hide unless the signal came from the
-            # format this action is about (see _has_original_metadata).
-            and _has_original_metadata(
-                signal, meta.get("requires_original_metadata"))
-            # requires_package: hide until the optional extra is installed
-            # (exspy / kikuchipy / atomap). Checked by find_spec, so this
-            # costs nothing and never imports the package.
-            and _packages_present(meta)
-            and (plot_state.dimensions in plot_dim)
-            and (
-                navigation_only is None
-                or navigation_only == plot_state.plot.is_navigator
-            )
-        )
-
-        if not add_action:
+        if not _action_matches_plot(action, meta, plot_state, gate):
             continue
+        params = meta.get("parameters", {})
 
-        function_path = meta["function"]
-        module_path, _, attr = function_path.rpartition(".")
-        base_func = getattr(importlib.import_module(module_path), attr)
+        base_func = resolve_action_function(meta["function"])
         wrapped_func = partial(base_func, action_name=action)
         functions.append(wrapped_func)
         icons.append(resolve_icon_path(meta["icon"]))
@@ -254,17 +285,14 @@ def get_toolbar_actions_for_plot(
         setup_fn = None
         setup_path = meta.get("setup_function")
         if setup_path:
-            s_module, _, s_attr = setup_path.rpartition(".")
-            setup_fn = getattr(importlib.import_module(s_module), s_attr)
+            setup_fn = resolve_action_function(setup_path)
         setup_functions.append(setup_fn)
 
         # Collect optional subfunctions
         sub_defs = meta.get("subfunctions", {})
         sub_entries = []
         for sub_meta in sub_defs:
-            sub_function_path = sub_defs[sub_meta]["function"]
-            sub_module_path, _, sub_attr = sub_function_path.rpartition(".")
-            sub_func = getattr(importlib.import_module(sub_module_path), sub_attr)
+            sub_func = resolve_action_function(sub_defs[sub_meta]["function"])
             sub_func = partial(sub_func, action_name=sub_meta)
             sub_entries.append(
                 (
@@ -282,10 +310,46 @@ def get_toolbar_actions_for_plot(
     return functions, icons, names, toolbar_sides, toggles, parameters, sub_toolbars, setup_functions
 
 
-def _action_matches_plot(action: str, meta: dict, plot_state: "PlotState") -> bool:
+@dataclass(slots=True)
+class _PlotGate:
+    """The per-plot inputs of the visibility filters. They do not depend on the
+    action, so a toolbar build reads them once instead of once per action."""
+
+    signal: object
+    signal_type: str
+    root_type: str
+    has_vectors: bool
+    dimensions: int
+    is_navigator: bool | None
+
+
+def _plot_gate(plot_state: "PlotState") -> _PlotGate:
+    """Snapshot *plot_state* for the visibility filters (see _PlotGate)."""
+    plot = plot_state.plot
+    # requires_vectors: action only shows once the plot's signal tree has
+    # diffraction_vectors attached (set after Find Vectors completes).
+    # PlotState.rebuild_toolbars() re-runs this filter at that point.
+    tree = getattr(plot, "signal_tree", None)
+    return _PlotGate(
+        signal=plot_state.current_signal,
+        signal_type=_gate_signal_type(plot_state, False),
+        root_type=_gate_signal_type(plot_state, True),
+        has_vectors=getattr(tree, "diffraction_vectors", None) is not None,
+        dimensions=plot_state.dimensions,
+        is_navigator=getattr(plot, "is_navigator", None),
+    )
+
+
+def _action_matches_plot(action: str, meta: dict, plot_state: "PlotState",
+                         gate: _PlotGate | None = None) -> bool:
     """Apply the same signal_type / dimension / vectors filters used to decide
     whether an action is offered for a plot — WITHOUT importing the action's
-    function module (so toolbar rendering never depends on heavy action code)."""
+    function module (so toolbar rendering never depends on heavy action code).
+
+    *gate* is the plot's precomputed _PlotGate; callers filtering many actions
+    for one plot pass it so the plot is only inspected once."""
+    if gate is None:
+        gate = _plot_gate(plot_state)
     signal_types = meta.get("signal_types")
     exclude_signal_types = meta.get("exclude_signal_types")
     signal_class = meta.get("signal_class")
@@ -293,30 +357,74 @@ def _action_matches_plot(action: str, meta: dict, plot_state: "PlotState") -> bo
     plot_dim = meta.get("plot_dim", [1, 2])
     navigation_only = meta.get("navigation")
 
-    signal = plot_state.current_signal
-    plot_signal_type = _gate_signal_type(plot_state, navigation_only)
-
-    tree = getattr(plot_state.plot, "signal_tree", None)
-    has_vectors = getattr(tree, "diffraction_vectors", None) is not None
+    signal = gate.signal
+    plot_signal_type = gate.root_type if navigation_only else gate.signal_type
 
     return (
         (signal_types is None or plot_signal_type in signal_types)
+        # exclude_signal_types: keep an action OFF a signal_type even though
+        # it would match signal_class by isinstance. Matched on the
+        # _signal_type STRING so it covers lazy+eager variants uniformly
+        # (LazyDiffractionVectorsImage is NOT a subclass of the eager one,
+        # but both share the signal_type) — the dense diffraction actions
+        # use this to stay off the vectors-result image.
         and (exclude_signal_types is None or plot_signal_type not in exclude_signal_types)
+        # signal_class gates by isinstance, so subclasses qualify too
+        # (e.g. ElectronDiffraction2D passes a Diffraction2D gate)
         and (
             signal_class is None
             or isinstance(signal, _resolve_signal_class(signal_class))
         )
-        and (not requires_vectors or has_vectors)
+        and (not requires_vectors or gate.has_vectors)
+        # requires_original_metadata: hide unless the signal came from the
+        # format this action is about (see _has_original_metadata).
         and _has_original_metadata(signal, meta.get("requires_original_metadata"))
+        # requires_package: hide until the optional extra is installed
+        # (exspy / kikuchipy / atomap). Checked by find_spec, so this
+        # costs nothing and never imports the package.
         and _packages_present(meta)
-        and (plot_state.dimensions in plot_dim)
+        and (gate.dimensions in plot_dim)
         and (
             navigation_only is None
-            or navigation_only == plot_state.plot.is_navigator
+            or navigation_only == gate.is_navigator
         )
     )
 
 
+_DESCRIPTOR_CACHE: dict[str, tuple[dict, dict]] = {}
+
+
+def _action_descriptor(action: str, meta: dict) -> dict:
+    """The renderer-facing descriptor for one action (icons resolved, sub-actions
+    expanded). Nothing in it depends on the plot, so it is built once per action
+    and reused on every rebuild; the entry is keyed on the *meta* object so an
+    action re-registered at runtime is rebuilt, never served stale."""
+    hit = _DESCRIPTOR_CACHE.get(action)
+    if hit is not None and hit[0] is meta:
+        return hit[1]
+
+    sub_actions = []
+    for sub_name, sub_meta in (meta.get("subfunctions", {}) or {}).items():
+        sub_actions.append({
+            "name": sub_name,
+            "icon": resolve_icon_path(sub_meta.get("icon", meta.get("icon", ""))),
+            "label": sub_meta.get("name", sub_name),
+            "toggle": sub_meta.get("toggle", False),
+            "parameters": sub_meta.get("parameters", {}),
+        })
+
+    descriptor = {
+        "name": action,
+        "icon": resolve_icon_path(meta.get("icon", "")),
+        "side": meta.get("toolbar_side", "left"),
+        "toggle": meta.get("toggle", False),
+        "parameters": meta.get("parameters", {}),
+        "subfunctions": sub_actions,
+    }
+    _DESCRIPTOR_CACHE[action] = (meta, descriptor)
+    return descriptor
+
+
 def get_toolbar_config_for_plot(plot_state: "PlotState") -> list[dict]:
     """
     Return a JSON-serialisable list of toolbar action descriptors for *plot_state*.
@@ -328,29 +436,22 @@ def get_toolbar_config_for_plot(plot_state: "PlotState") -> list[dict]:
     The function is resolved on demand when the action is actually invoked.
     """
     actions = []
+    try:
+        gate = _plot_gate(plot_state)
+    except (AttributeError, TypeError) as e:
+        # No displayable signal yet (e.g. a state torn down mid-rebuild): an
+        # empty toolbar, not a crash.
+        logger.debug("toolbar gate unavailable for %r: %s", plot_state, e)
+        return actions
     for action, meta in TOOLBAR_ACTIONS["functions"].items():
         try:
-            if not _action_matches_plot(action, meta, plot_state):
+            if not _action_matches_plot(action, meta, plot_state, gate):
                 continue
-        except Exception:
+        except Exception as e:
+            # One bad action entry (e.g. an unimportable signal_class) hides
+            # that action only — but say why, rather than silently dropping it.
+            logger.debug("toolbar filter for %r failed: %s", action, e)
             continue
-
-        sub_actions = []
-        for sub_name, sub_meta in (meta.get("subfunctions", {}) or {}).items():
-            sub_actions.append({
-                "name": sub_name,
-                "icon": resolve_icon_path(sub_meta.get("icon", meta.get("icon", ""))),
-                "label": sub_meta.get("name", sub_name),
-                "toggle": sub_meta.get("toggle", False),
-                "parameters": sub_meta.get("parameters", {}),
-            })
-
-        actions.append({
-            "name": action,
-            "icon": resolve_icon_path(meta.get("icon", "")),
-            "side": meta.get("toolbar_side", "left"),
-            "toggle": meta.get("toggle", False),
-            "parameters": meta.get("parameters", {}),
-            "subfunctions": sub_actions,
-        })
+        # Shallow copy: the cached descriptor must not pick up per-plot keys.
+        actions.append(dict(_action_descriptor(action, meta)))
     return actions
@@ -0,0 +1,29 @@
+"""ActionContext's per-plot action state (the old toolbar ``action_widgets``).
+
+The state must outlive a single ActionContext — every click builds a fresh
+context — so it lives on the plot, one ActionSlot per action name.
+"""
+from __future__ import annotations
+
+import types
+
+from spyde.actions.context import ActionContext, ActionSlot
+
+
+class TestActionSlots:
+    def test_state_survives_across_contexts(self):
+        plot = types.SimpleNamespace()
+        ActionContext(plot, action_name="FFT").register_action_plot_window(
+            "FFT", "win", key="FFT_Plot_Window")
+        slot = ActionContext(plot).action_widgets["FFT"]
+        assert isinstance(slot, ActionSlot)
+        assert slot.plot_windows == {"FFT_Plot_Window": "win"}
+
+    def test_registrations_share_one_slot(self):
+        ctx = ActionContext(types.SimpleNamespace())
+        ctx.register_action_plot_item("A", "roi", key="Selector")
+        ctx.add_action_widget("A", widget="w", layout="l")
+        slot = ctx.action_slot("A")
+        assert slot.plot_items == {"Selector": "roi"}
+        assert (slot.widget, slot.layout) == ("w", "l")
+        assert slot.plot_windows == {}
@@ -104,3 +104,25 @@ class TestOverlayVisibility:
             session._set_overlay(None, "Find Diffraction Vectors", True)
         finally:
             session.shutdown()
+
+
+class TestOverlaySources:
+    def test_wizard_overlays_toggle_through_the_table(self):
+        import types
+        from spyde.backend._session_actions import ActionRouterMixin
+
+        class _Overlay:
+            visible = None
+
+            def set_visible(self, v):
+                self.visible = v
+
+        tpl, wiz_ov = _Overlay(), _Overlay()
+        tree = types.SimpleNamespace(
+            _orientation_overlay=tpl,
+            _om_wizard=types.SimpleNamespace(overlay=wiz_ov))
+        plot = types.SimpleNamespace(signal_tree=tree)
+        ActionRouterMixin._set_overlay(None, plot, "Orientation Mapping", False)
+        assert tpl.visible is False and wiz_ov.visible is False
+        # A wizard that was never opened has no overlay to toggle.
+        ActionRouterMixin._set_overlay(None, plot, "EBSD Indexing", True)
@@ -5,9 +5,9 @@ until that extra is importable, so a user without `spyde[eels]` never sees a
 button that would raise ImportError when clicked.
 
 Both filter paths are covered. `get_toolbar_actions_for_plot` (which resolves
-and imports the action function) and `get_toolbar_config_for_plot` /
-`_action_matches_plot` (which must NOT import anything) apply the same gates,
-and it is easy to add a gate to one and forget the other.
+and imports the action function) and `get_toolbar_config_for_plot` (which must
+NOT import anything) both filter through `_action_matches_plot`, so a gate
+added there reaches both.
 """
 from __future__ import annotations
 
@@ -138,13 +138,16 @@ class TestFilterIntegration:
     def test_gate_is_wired_into_both_filters(self):
         """Guards the real failure mode: adding the gate to one filter and
         forgetting the other, so the button renders but does not dispatch (or
-        vice versa)."""
+        vice versa). Both listings go through _action_matches_plot, which
+        carries the gate."""
         import inspect
-        src = inspect.getsource(pct)
-        body = src.split("def get_toolbar_actions_for_plot", 1)[1]
-        listing, matching = body.split("def _action_matches_plot", 1)
-        assert "_packages_present" in listing, \
-            "get_toolbar_actions_for_plot is missing the requires_package gate"
+        listing = inspect.getsource(pct.get_toolbar_actions_for_plot)
+        config = inspect.getsource(pct.get_toolbar_config_for_plot)
+        matching = inspect.getsource(pct._action_matches_plot)
+        assert "_action_matches_plot(" in listing, \
+            "get_toolbar_actions_for_plot does not use the shared filter"
+        assert "_action_matches_plot(" in config, \
+            "get_toolbar_config_for_plot does not use the shared filter"
         assert "_packages_present" in matching, \
             "_action_matches_plot is missing the requires_package gate"
 
@@ -0,0 +1,180 @@
+"""Toolbar metadata lookups behind the Electron per-plot toolbar.
+
+The renderer only ever names an action; the backend has to get from that name
+back to its TOOLBAR_ACTIONS meta on every click, so the lookup is indexed
+rather than a scan of every parent's subfunctions.
+"""
+from __future__ import annotations
+
+from spyde import TOOLBAR_ACTIONS
+from spyde.drawing.toolbars import plot_control_toolbar as pct
+from spyde.drawing.toolbars.plot_control_toolbar import toolbar_action_meta
+
+
+def _first_sub_action():
+    for parent in TOOLBAR_ACTIONS["functions"].values():
+        for sub_name, sub_meta in (parent.get("subfunctions", {}) or {}).items():
+            return sub_name, sub_meta
+    return None, None
+
+
+class TestToolbarActionMeta:
+    def test_top_level_action(self):
+        name, meta = next(iter(TOOLBAR_ACTIONS["functions"].items()))
+        assert toolbar_action_meta(name) is meta
+
+    def test_sub_action(self):
+        sub_name, sub_meta = _first_sub_action()
+        assert sub_name is not None, "no shipped action declares subfunctions"
+        assert toolbar_action_meta(sub_name) is sub_meta
+
+    def test_unknown_action_is_none(self):
+        assert toolbar_action_meta("spyde_no_such_action") is None
+
+    def test_runtime_registered_action_is_found(self, monkeypatch):
+        """A top-level action added after the index was built is not missed."""
+        toolbar_action_meta("spyde_no_such_action")
+        meta = {"function": "builtins.print"}
+        monkeypatch.setitem(TOOLBAR_ACTIONS["functions"], "Late Action", meta)
+        assert toolbar_action_meta("Late Action") is meta
+
+    def test_runtime_registered_sub_action_is_found(self, monkeypatch):
+        """A miss rebuilds the sub-action index instead of trusting a stale one."""
+        monkeypatch.setattr(pct, "_SUB_ACTION_INDEX", {})
+        toolbar_action_meta("spyde_no_such_action")
+        sub = {"function": "builtins.print"}
+        parent = {"function": "builtins.print", "subfunctions": {"late_sub": sub}}
+        monkeypatch.setitem(TOOLBAR_ACTIONS["functions"], "Late Parent", parent)
+        assert toolbar_action_meta("late_sub") is sub
+        assert pct._SUB_ACTION_INDEX["late_sub"] == ("Late Parent", sub)
+
+    def test_removed_sub_action_is_not_served_stale(self, monkeypatch):
+        monkeypatch.setattr(pct, "_SUB_ACTION_INDEX", {})
+        sub = {"function": "builtins.print"}
+        parent = {"function": "builtins.print", "subfunctions": {"late_sub": sub}}
+        monkeypatch.setitem(TOOLBAR_ACTIONS["functions"], "Late Parent", parent)
+        assert toolbar_action_meta("late_sub") is sub
+        monkeypatch.delitem(TOOLBAR_ACTIONS["functions"], "Late Parent")
+        assert toolbar_action_meta("late_sub") is None
+
+    def test_replaced_sub_action_is_not_served_stale(self, monkeypatch):
+        monkeypatch.setattr(pct, "_SUB_ACTION_INDEX", {})
+        old, new = {"function": "builtins.print"}, {"function": "builtins.repr"}
+        monkeypatch.setitem(TOOLBAR_ACTIONS["functions"], "Late Parent",
+                            {"function": "builtins.print", "subfunctions": {"late_sub": old}})
+        assert toolbar_action_meta("late_sub") is old
+        monkeypatch.setitem(TOOLBAR_ACTIONS["functions"], "Late Parent",
+                            {"function": "builtins.print", "subfunctions": {"late_sub": new}})
+        assert toolbar_action_meta("late_sub") is new
+
+
+class TestActionDescriptorCache:
+    def test_descriptor_is_built_once_per_action(self):
+        name, meta = next(iter(TOOLBAR_ACTIONS["functions"].items()))
+        assert pct._action_descriptor(name, meta) is pct._action_descriptor(name, meta)
+
+    def test_replaced_meta_is_not_served_stale(self, monkeypatch):
+        name, meta = next(iter(TOOLBAR_ACTIONS["functions"].items()))
+        pct._action_descriptor(name, meta)
+        replaced = dict(meta, toolbar_side="right")
+        monkeypatch.setitem(TOOLBAR_ACTIONS["functions"], name, replaced)
+        assert pct._action_descriptor(name, replaced)["side"] == "right"
+
+
+class TestResolveIconPath:
+    def test_relative_icon_resolves_under_the_package(self):
+        from pathlib import Path
+        import spyde
+        out = pct.resolve_icon_path("drawing/toolbars/icons/none.svg")
+        assert Path(out).is_absolute()
+        assert out.startswith(str(Path(spyde.__file__).resolve().parent))
+
+    def test_resolution_is_cached(self):
+        out = pct.resolve_icon_path("drawing/toolbars/icons/none.svg")
+        assert pct._ICON_PATH_CACHE["drawing/toolbars/icons/none.svg"] == out
+
+    def test_resource_paths_pass_through(self):
+        assert pct.resolve_icon_path(":/icons/foo.png") == ":/icons/foo.png"
+
+
+class TestPlotGate:
+    _UNSET = object()
+
+    def _plot_state(self, signal_type="", root_type=None, is_navigator=_UNSET,
+                    vectors=None, dimensions=2):
+        import types
+        plot = types.SimpleNamespace()
+        if is_navigator is not self._UNSET:
+            plot.is_navigator = is_navigator
+        root = (types.SimpleNamespace(_signal_type=root_type)
+                if root_type is not None else None)
+        plot.signal_tree = types.SimpleNamespace(diffraction_vectors=vectors,
+                                                 root=root)
+        return types.SimpleNamespace(
+            current_signal=types.SimpleNamespace(_signal_type=signal_type),
+            dimensions=dimensions, plot=plot)
+
+    def _check(self, state, cases):
+        gate = pct._plot_gate(state)
+        for meta, expected in cases:
+            assert pct._action_matches_plot("X", meta, state, gate) is expected, meta
+
+    def test_navigation_flag(self):
+        nav = self._plot_state("electron_diffraction", root_type="insitu",
+                               is_navigator=True)
+        sig = self._plot_state("electron_diffraction", root_type="insitu",
+                               is_navigator=False)
+        self._check(nav, [
+            ({"navigation": True}, True),
+            ({"navigation": False}, False),
+            ({}, True),
+            # navigator-only gates resolve against the tree root's type
+            ({"signal_types": ["insitu"], "navigation": True}, True),
+            # ungated actions keep reading the displayed signal's type
+            ({"signal_types": ["insitu"]}, False),
+            ({"signal_types": ["electron_diffraction"]}, True),
+        ])
+        self._check(sig, [
+            ({"navigation": True}, False),
+            ({"navigation": False}, True),
+            ({"signal_types": ["electron_diffraction"], "navigation": False}, True),
+        ])
+
+    def test_requires_vectors(self):
+        self._check(self._plot_state(is_navigator=False), [
+            ({"requires_vectors": True}, False),
+            ({"requires_vectors": False}, True),
+        ])
+        self._check(self._plot_state(is_navigator=False, vectors=object()), [
+            ({"requires_vectors": True}, True),
+        ])
+
+    def test_plot_without_is_navigator(self):
+        """A plot lacking is_navigator only matches actions with no navigation gate."""
+        self._check(self._plot_state(), [
+            ({}, True),
+            ({"navigation": True}, False),
+            ({"navigation": False}, False),
+        ])
+
+    def test_plot_dim(self):
+        self._check(self._plot_state(is_navigator=False, dimensions=2), [
+            ({"plot_dim": [1]}, False),
+            ({"plot_dim": [2]}, True),
+            ({}, True),
+        ])
+        self._check(self._plot_state(is_navigator=False, dimensions=3), [
+            ({}, False),
+        ])
+
+    def test_navigation_actions_gate_on_the_tree_root(self):
+        state = self._plot_state("", root_type="insitu", is_navigator=True)
+        meta = {"signal_types": ["insitu"], "navigation": True}
+        assert pct._action_matches_plot("Play", meta, state) is True
+
+
+class TestResolveActionFunction:
+    def test_resolves_and_caches_a_dotted_path(self):
+        import os.path
+        assert pct.resolve_action_function("os.path.join") is os.path.join
+        assert pct._FUNCTION_CACHE["os.path.join"] is os.path.join